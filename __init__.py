@@ -15,7 +15,12 @@ import bpy.utils
 import importlib as _importlib
 
 from . import addon_add_object
-_importlib.reload(addon_add_object)
+# Reloading is only useful while developing the add-on. Set the
+# environment variable SYMPLE_DEV (to any non-empty value) before
+# starting Blender to reload the submodule whenever the add-on is
+# enabled.
+if _os.environ.get("SYMPLE_DEV"):
+    _importlib.reload(addon_add_object)
 
 
 ADDON_FOLDER_PATH = _os.path.dirname(__file__)
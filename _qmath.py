@@ -0,0 +1,201 @@
+"""Numeric kernels on NumPy arrays of quaternions, stored as rows (w,
+x, y, z), and other small geometric kernels. Does not depend on bpy
+nor mathutils.
+
+Kernels with an explicit loop are compiled with numba the first time
+they are called, if numba is installed. Since Blender does not bundle
+numba, an equivalent NumPy implementation is used otherwise.
+
+"""
+from functools import wraps
+from math import pi, acos, cos, sin
+
+import numpy as np
+
+
+def _jit_or(fallback=None, **options):
+    """Decorator that compiles the function with `numba.njit(**options)`
+    on its first call, or uses `fallback` (by default, the function
+    itself) instead if numba is not available. Importing numba is
+    slow, so it is not done until needed.
+
+    """
+    def decorator(kernel):
+        impl = None
+
+        @wraps(kernel)
+        def wrapper(*args):
+            nonlocal impl
+            if impl is None:
+                try:
+                    from numba import njit
+                except ImportError:
+                    impl = kernel if fallback is None else fallback
+                else:
+                    impl = njit(**options)(kernel)
+            return impl(*args)
+        return wrapper
+    return decorator
+
+
+def _numpy_batch_qmul(a, b):
+    aw, ax, ay, az = a.T
+    bw, bx, by, bz = b.T
+    return np.stack((aw*bw - ax*bx - ay*by - az*bz,
+                     aw*bx + ax*bw + ay*bz - az*by,
+                     aw*by - ax*bz + ay*bw + az*bx,
+                     aw*bz + ax*by - ay*bx + az*bw), axis=1)
+
+
+@_jit_or(_numpy_batch_qmul, cache=True, fastmath=True)
+def batch_qmul(a, b):
+    """Hamilton product of two (N, 4) arrays of quaternions, row by
+    row"""
+    out = np.empty_like(a)
+    for i in range(len(a)):
+        aw, ax, ay, az = a[i, 0], a[i, 1], a[i, 2], a[i, 3]
+        bw, bx, by, bz = b[i, 0], b[i, 1], b[i, 2], b[i, 3]
+        out[i, 0] = aw*bw - ax*bx - ay*by - az*bz
+        out[i, 1] = aw*bx + ax*bw + ay*bz - az*by
+        out[i, 2] = aw*by - ax*bz + ay*bw + az*bx
+        out[i, 3] = aw*bz + ax*by - ay*bx + az*bw
+    return out
+
+
+def outer_qmul(a, b):
+    """(M, N, 4) array with the Hamilton products of each of the M
+    quaternions in a by each of the N quaternions in b
+
+    """
+    # Multiplying by q on the right is linear, so all the products
+    # come from a single matrix product
+    bw, bx, by, bz = np.asarray(b, dtype=float).T
+    right = np.array(((bw, bx, by, bz),
+                      (-bx, bw, -bz, by),
+                      (-by, bz, bw, -bx),
+                      (-bz, -by, bx, bw)))
+    return (a @ right.reshape(4, -1)).reshape(len(a), 4, -1).swapaxes(1, 2)
+
+
+def close_pairs(qs, ps, epsilon2):
+    """(M, N) boolean array telling, for the rows of the (M, 4) array
+    qs and the (N, 4) array ps, whether each q or its opposite is
+    closer than sqrt(epsilon2) to each p
+
+    """
+    # |p ∓ q|² = |p|² + |q|² ∓ 2p·q
+    d2 = (np.einsum('ij,ij->i', qs, qs)[:, None]
+          + np.einsum('ij,ij->i', ps, ps)
+          - 2*np.abs(qs @ ps.T))
+    return d2 < epsilon2
+
+
+def _numpy_enum_group(gens, out, epsilon2):
+    # Each step multiplies the elements found in the previous step by
+    # all the generators at once, and keeps the products that are not
+    # close to any element found yet
+    size = len(out)
+    out[0] = 1, 0, 0, 0
+    n = 1
+    start = 0                           # Elements found in the last step
+    while n < size:
+        # Products g @ gen, for each gen and then each g
+        candidates = outer_qmul(out[start:n], gens)
+        candidates = candidates.swapaxes(0, 1).reshape(-1, 4)
+        known = close_pairs(candidates, out[:n], epsilon2).any(axis=1)
+        candidates = candidates[~known]
+        # Among themselves, only the first of each repeated element
+        same = close_pairs(candidates, candidates, epsilon2)
+        candidates = candidates[~np.tril(same, -1).any(axis=1)]
+        if not len(candidates):
+            break
+        candidates = candidates[:size - n]
+        start, n = n, n + len(candidates)
+        out[start:n] = candidates
+    return n
+
+
+@_jit_or(_numpy_enum_group, cache=True)
+def enum_group(gens, out, epsilon2):
+    """Fills the (N, 4) array out with elements of the group generated
+    by the rows of gens, starting by the identity and multiplying
+    breadth-first by the generators on the right. Quaternions closer
+    than sqrt(epsilon2), or than that to the opposite, are considered
+    the same. Returns how many were found, which is less than N only
+    if the group is smaller.
+
+    """
+    size = len(out)
+    out[0, 0], out[0, 1], out[0, 2], out[0, 3] = 1.0, 0.0, 0.0, 0.0
+    n = 1
+    if n == size:
+        return n
+    start, end = 0, 1                   # Elements found in the last step
+    while start < end:
+        for i in range(len(gens)):
+            bw, bx, by, bz = gens[i, 0], gens[i, 1], gens[i, 2], gens[i, 3]
+            for j in range(start, end):
+                aw, ax, ay, az = out[j, 0], out[j, 1], out[j, 2], out[j, 3]
+                w = aw*bw - ax*bx - ay*by - az*bz
+                x = aw*bx + ax*bw + ay*bz - az*by
+                y = aw*by - ax*bz + ay*bw + az*bx
+                z = aw*bz + ax*by - ay*bx + az*bw
+                qq = w*w + x*x + y*y + z*z
+                known = False
+                for m in range(n):
+                    pw, px, py, pz = out[m, 0], out[m, 1], out[m, 2], out[m, 3]
+                    pq = abs(pw*w + px*x + py*y + pz*z)
+                    if pw*pw + px*px + py*py + pz*pz + qq - 2*pq < epsilon2:
+                        known = True
+                        break
+                if not known:
+                    out[n, 0], out[n, 1], out[n, 2], out[n, 3] = w, x, y, z
+                    n += 1
+                    if n == size:
+                        return n
+        start, end = end, n
+    return n
+
+
+def spherical_triangle(M, N, P):
+    """Vertices pa, pb, pc, as (x, y, z) tuples, of the spherical
+    triangle with angles pi/M, pi/N, pi/P at each of them. pa is the
+    North pole and pb lies on the XZ plane, with positive X.
+
+    """
+    A, B, C = pi/M, pi/N, pi/P
+    cos_a, cos_b, cos_c = cos(A), cos(B), cos(C)
+    sin_a, sin_b, sin_c = sin(A), sin(B), sin(C)
+
+    # Side lengths
+    c = acos((cos_c + cos_a*cos_b)/(sin_a*sin_b))
+    b = acos((cos_b + cos_c*cos_a)/(sin_c*sin_a))
+
+    # pb is pa rotated by c around Y, and pc is pa rotated by b around
+    # Y rotated by A around Z, that is, (-sin A, cos A, 0)
+    sin_side = sin(b)
+    return ((0.0, 0.0, 1.0),
+            (sin(c), 0.0, cos(c)),
+            (cos_a*sin_side, sin_a*sin_side, cos(b)))
+
+
+def batch_to_matrix(quats, scales):
+    """(N, 4, 4) array of transformation matrices that rotate by each
+    of the unit quaternions in `quats` after scaling by the
+    corresponding row of `scales`, with no translation.
+
+    """
+    w, x, y, z = quats.T
+    out = np.zeros((len(quats), 4, 4), dtype=quats.dtype)
+    out[:, 0, 0] = 1 - 2*(y*y + z*z)
+    out[:, 0, 1] = 2*(x*y - w*z)
+    out[:, 0, 2] = 2*(x*z + w*y)
+    out[:, 1, 0] = 2*(x*y + w*z)
+    out[:, 1, 1] = 1 - 2*(x*x + z*z)
+    out[:, 1, 2] = 2*(y*z - w*x)
+    out[:, 2, 0] = 2*(x*z - w*y)
+    out[:, 2, 1] = 2*(y*z + w*x)
+    out[:, 2, 2] = 1 - 2*(x*x + y*y)
+    out[:, :3, :3] *= scales[:, None, :]
+    out[:, 3, 3] = 1
+    return out
@@ -6,16 +6,20 @@ according to the symmetry. The second one
 active object's data.
 
 """
-from functools import reduce
-from operator import mul
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import chain
+
+import numpy as np
 
 import bpy
 import bpy.types
 from bpy.props import StringProperty, EnumProperty, BoolProperty, FloatVectorProperty
 from bpy_extras.object_utils import AddObjectHelper, object_data_add
 
-from .simetrias import SymGrp, BadSymGrpError
-from .utils import Vector, Quaternion
+from ._qmath import batch_qmul, batch_to_matrix
+from .simetrias import sym_grp, BadSymGrpError
+from .utils import Matrix
 
 
 MODES = (
@@ -28,6 +32,7 @@ MODES = (
     ('OBJECT', "Object",
      "Active object.",
      "OBJECT_DATA", 2))
+_MODES_NO_OBJECT = MODES[:-1]
 SIGNATURES =  (
         "", "1", "*", "x",
         "2*", "3*", "4*", "5*", "6*",
@@ -48,12 +53,89 @@ SIGNATURES =  (
         "3*2",
         "2*2", "2*3", "2*4", "2*5", "2*6",
 )
+# For O(1) membership tests; the tuple keeps the order for the UI
+SIGNATURES_SET = frozenset(SIGNATURES)
+# Sorted copy for prefix search, and the position of each signature in
+# SIGNATURES to keep the search results in the same order
+_SORTED_SIGNATURES = tuple(sorted(SIGNATURES))
+_SIGNATURE_ORDER = {s: i for i, s in enumerate(SIGNATURES)}
+_TRUE3 = (True, True, True)
+
+
+@lru_cache(maxsize=64)
+def _get_tile(signature):
+    """Fundamental tile of the group as read-only arrays ready to be
+    copied into a mesh: (N, 3) float32 vertices, and int32 loop starts
+    and vertex indices of the faces
+
+    """
+    verts, faces = sym_grp(signature).tile
+    verts = np.asarray(verts, dtype=np.float32)
+    loop_totals = np.fromiter(map(len, faces), dtype=np.int32,
+                              count=len(faces))
+    loop_starts = np.zeros_like(loop_totals)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    vertex_indices = np.fromiter(chain.from_iterable(faces), dtype=np.int32)
+    for array in verts, loop_starts, vertex_indices:
+        array.flags.writeable = False
+    return verts, loop_starts, vertex_indices
+
+
+def _rotate_verts(q, verts):
+    """Rotate all the vertices at once by the unit quaternion q.
+    Returns an (N, 3) float32 array.
+
+    Uses v' = v + 2w(u×v) + 2u×(u×v), where u is the vector part of
+    q, which avoids one quaternion product per vertex.
+
+    """
+    w, x, y, z = q
+    u = np.array((x, y, z), dtype=np.float32)
+    V = np.asarray(verts, dtype=np.float32)
+    t = 2*np.cross(u, V)
+    return V + w*t + np.cross(u, t)
+
+
+def _fill_mesh(data, verts, loop_starts, vertex_indices):
+    """Fill an empty mesh from the arrays given by `_get_tile`, copying
+    whole buffers at once instead of going through `from_pydata`.
+
+    """
+    data.vertices.add(len(verts))
+    data.attributes["position"].data.foreach_set("vector", verts.ravel())
+    data.loops.add(len(vertex_indices))
+    data.loops.foreach_set("vertex_index", vertex_indices)
+    # Face sizes follow from the loop starts (loop_total is read-only)
+    data.polygons.add(len(loop_starts))
+    data.polygons.foreach_set("loop_start", loop_starts)
+    data.update(calc_edges=True)
+
+
+def _new_tile_mesh(signature, extra_rotation, is_identity):
+    """New mesh with the fundamental tile rotated by the inverse of
+    extra_rotation"""
+    verts, loop_starts, vertex_indices = _get_tile(signature)
+    if not is_identity:
+        verts = _rotate_verts(extra_rotation.conjugated(), verts)
+    data = bpy.data.meshes.new('Tile')
+    _fill_mesh(data, verts, loop_starts, vertex_indices)
+    return data
+
+
+# For each mode, given the active object and the tile mesh, a function
+# that makes a new (unlinked) object
+_MODE_FACTORIES = {
+    'TILE': lambda ao, data: lambda: bpy.data.objects.new('Tile', data),
+    'AXES': lambda ao, data: lambda: bpy.data.objects.new('Axis', None),
+    'OBJECT': lambda ao, data: ao.copy,
+}
 
 
 def add_symgrp(operator, context):
     """Add a fundamental tile with a specified symmetry group"""
     try:
-        grp = SymGrp(operator.signature)
+        grp = sym_grp(operator.signature)
+        grp.axes                # Unsupported groups fail here
     except (BadSymGrpError, NotImplementedError) as e:
         operator.report(
             {'ERROR_INVALID_INPUT'},
@@ -61,52 +143,67 @@ def add_symgrp(operator, context):
         return {'CANCELLED'}
     
     extra_rotation = operator.extra_rotation.to_quaternion()
-    match operator.mode:
-        case 'TILE':
-            verts, faces = grp.tile
-            verts = tuple(extra_rotation.conjugated() @ v for v in verts)
-            data = bpy.data.meshes.new('Tile')
-            data.from_pydata(verts, (), faces)
-            object_add_command = lambda: bpy.data.objects.new('Tile', data)
-        case 'AXES':
-            object_add_command = lambda: bpy.data.objects.new('Axis', None)
-        case 'OBJECT':
-            ao = context.active_object
-            object_add_command = lambda: ao.copy()
-            
+    is_identity = abs(extra_rotation.w - 1.0) < 1e-9
+    data = None
+    if operator.mode == 'TILE':
+        data = _new_tile_mesh(operator.signature, extra_rotation,
+                              is_identity)
+    object_add_command = _MODE_FACTORIES[operator.mode](
+        context.active_object, data)
+
     empty = object_data_add(context, None,
                             name = f"SymGrp {grp.signature}",
                             operator=operator)
-    for axis, scale in grp:
+    # The extra rotation is applied first. Its axis has to be
+    # multiplied by the corresponding scale in order to keep the
+    # mirror. The angle also has to be inverted if the orientation is
+    # negative. Only then is the rotation of the individual group
+    # element applied.
+    axes = grp.quats_array.astype(np.float32)
+    scales = grp.scales_array.astype(np.float32)
+    dets = scales.prod(axis=1)
+    if is_identity:
+        # The component-wise product with (1, 0, 0, 0) is (det, 0, 0, 0)
+        quats = axes * dets[:, None]
+    else:
+        inner = np.column_stack((dets, scales))
+        inner *= np.array(extra_rotation, dtype=np.float32) # Component-wise
+        quats = batch_qmul(axes, inner)
+    matrices = batch_to_matrix(quats, scales)
+
+    # Objects are linked only once they are fully set up, so that the
+    # dependency graph is updated once per object
+    pending = []
+    for matrix in matrices:
         tile = object_add_command()
-        context.collection.objects.link(tile)
         tile.parent = empty
         tile.empty_display_type = 'SINGLE_ARROW'
-        tile.location = Vector()
+        # Blender decomposes the matrix into location, rotation and
+        # scale. The basis (not the local) matrix is set, since copies
+        # of the active object keep its parent inverse matrix.
         tile.rotation_mode = 'QUATERNION'
-        # The extra rotation is applied first. Its axis has to be
-        # multiplied by the corresponding scale in order to keep the
-        # mirror. The angle also has to be inverted if the orientation
-        # is negative. Only then is the rotation of the individual
-        # group element applied.
-        tile.rotation_quaternion = axis @ (
-            extra_rotation * Quaternion((reduce(mul, scale), *scale)))
-        tile.scale = scale
+        tile.matrix_basis = Matrix(matrix.tolist())
         if operator.lock:
-            for transform in "location", "rotation", "scale":
-                setattr(tile, f"lock_{transform}", (True, True, True))
+            tile.lock_location = _TRUE3
+            tile.lock_rotation = _TRUE3
+            tile.lock_scale = _TRUE3
             tile.lock_rotation_w = True
+        pending.append(tile)
+    link = context.collection.objects.link
+    for tile in pending:
+        link(tile)
 
-    for obj in context.selected_objects:
-        obj.select_set(False)
+    if context.selected_objects:
+        bpy.ops.object.select_all(action='DESELECT')
     empty.select_set(True)
     context.view_layer.objects.active = empty
     return {'FINISHED'}
         
 
 def search_signature(operator, context, value):
-    return (s for s in SIGNATURES
-            if s.startswith(value))
+    lo = bisect_left(_SORTED_SIGNATURES, value)
+    hi = bisect_right(_SORTED_SIGNATURES, value + "\uffff", lo)
+    return sorted(_SORTED_SIGNATURES[lo:hi], key=_SIGNATURE_ORDER.get)
 
 
 # Class definitions
@@ -150,7 +247,7 @@ class OBJECT_OT_add_symgrp(SymGrpAdder):
         name = "Mode",
         #default = 'TILE',
         translation_context = "SymGrp button",
-        items = MODES[:-1],
+        items = _MODES_NO_OBJECT,
     )
 
 
@@ -193,6 +290,8 @@ def symgrp_from_object_menu(self, context):
 # Registration
         
 def register():
+    sym_grp.cache_clear()
+    _get_tile.cache_clear()
     bpy.utils.register_class(OBJECT_OT_add_symgrp)
     bpy.utils.register_class(OBJECT_OT_symgrp_from_object)
     bpy.types.VIEW3D_MT_add.append(add_symgrp_menu)
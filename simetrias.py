@@ -8,17 +8,76 @@ Right now, only spherical groups are supported, which are harder than
 planar groups to achieve in plain Blender.
 
 """
+from collections.abc import Sequence
+from functools import lru_cache
 from math import pi ,inf, cos, acos, sin
 from string import digits
 
+import numpy as np
+
+from ._qmath import spherical_triangle
 from .utils import (
     group_from_gens_size,
-    ImmutableList,
     ImmutableModifyError,
     Quaternion, Vector,
+    rotate_axis_angle,
 )
 
 
+# Scales of the direct and inverse symmetries (frozen, since they are
+# shared by all the groups)
+_POS_Y = Vector((1,1,1)).freeze()
+_NEG_Y = Vector((1,-1,1)).freeze()
+
+# Unit vectors along each axis, shared by the groups (frozen)
+_EX, _EY, _EZ, _NEX, _NEY, _NEZ = (v.freeze() for v in (
+    Vector((1,0,0)), Vector((0,1,0)), Vector((0,0,1)),
+    Vector((-1,0,0)), Vector((0,-1,0)), Vector((0,0,-1)),
+))
+
+# Default vertices and faces of the tile (an octahedron), for when
+# there are no symmetries
+_DEFAULT_VERTS = (_EZ, _NEZ, _EX, _NEX, _EY, _NEY)
+_DEFAULT_FACES = ((0,2,4), (0,5,2), (0,4,3), (0,3,5),
+                  (1,4,2), (1,2,5), (1,3,4), (1,5,3),
+                  )
+
+
+class _AllAxesView(Sequence):
+    """Read-only sequence of the pairs (axis, scale) of a group: the
+    direct symmetries with scale _POS_Y followed by the inverse ones
+    with scale _NEG_Y. The pairs are made on access instead of being
+    stored.
+
+    """
+    __slots__ = ('_axes', '_inverse_axes')
+
+    def __init__(self, axes, inverse_axes):
+        self._axes = axes
+        self._inverse_axes = inverse_axes
+
+    def __len__(self):
+        return len(self._axes) + len(self._inverse_axes)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return tuple(self[i] for i in range(*position.indices(len(self))))
+        n = len(self._axes)
+        if position < 0:
+            position += len(self)
+        if 0 <= position < n:
+            return self._axes[position], _POS_Y
+        if n <= position < len(self):
+            return self._inverse_axes[position - n], _NEG_Y
+        raise IndexError("SymGrp index out of range")
+
+    def __iter__(self):
+        for axis in self._axes:
+            yield axis, _POS_Y
+        for axis in self._inverse_axes:
+            yield axis, _NEG_Y
+
+
 class BadSymGrpError(ValueError):
     """For symmetry groups that have impossible signatures or that do
     not make planar / spherical patterns
@@ -27,25 +86,131 @@ class BadSymGrpError(ValueError):
     pass
 
 
+class _ForbidCenters():
+    """Stands for the centers where no more centers can be added"""
+    __slots__ = ('err',)
+
+    def __init__(self, err):
+        self.err = err
+
+    def append(self, _):
+        raise ImmutableModifyError(self.err)
+
+
+class _ParseState():
+    """Mutable state of SymGrp._parse while reading a signature. Each
+    method handles one kind of character (see `_TRANSITIONS`), given
+    the character itself.
+
+    """
+    def __init__(self):
+        self.gyrations = []
+        self.kaleidoscopes = []
+        self.centers = self.gyrations     # Where new numbers go
+        self.parens = None                # Digits read inside parens
+        self.stars = self.xs = self.os = 0
+
+    def open_parens(self, char):
+        self.parens = []
+
+    def parens_digit(self, char):
+        self.parens.append(char)
+
+    def close_parens(self, char):
+        N = int("".join(self.parens))
+        self.centers.append(inf if N == 0 else N)
+        self.parens = None
+
+    def center(self, char):
+        self.centers.append(int(char))
+
+    def infinity(self, char):
+        self.centers.append(inf)
+
+    def star(self, char):
+        self.centers = self.kaleidoscopes
+        self.stars += 1
+
+    def miracle(self, char):
+        self.xs += 1
+        self.centers = _ForbidCenters(
+            "Miracle (x) with centers is impossible"
+        )
+
+    def wonder(self, char):
+        if self.centers is not self.gyrations:
+            raise ValueError(
+                "Wandering (o) after inverse symmetry is impossible"
+            )
+        self.os += 1
+
+
+def _center_str(N):
+    """How a center of order N is written in a normalized signature"""
+    if N == inf:
+        return "0"
+    return str(N) if N < 10 else f"({N})"
+
+
+# Class of each character allowed in a signature
+_CHAR_CLASSES = {
+    **dict.fromkeys(digits[1:], 'DIGIT'),
+    "0": 'ZERO', "∞": 'INFINITY',
+    "(": 'OPEN', ")": 'CLOSE',
+    "*": 'STAR', "★": 'STAR',
+    "x": 'MIRACLE', "❌": 'MIRACLE', "✕": 'MIRACLE',
+    "o": 'WONDER',
+}
+# Handler for each (inside parens, character class). Missing pairs are
+# errors.
+_TRANSITIONS = {
+    (False, 'DIGIT'): _ParseState.center,
+    (False, 'ZERO'): _ParseState.infinity,
+    (False, 'INFINITY'): _ParseState.infinity,
+    (False, 'OPEN'): _ParseState.open_parens,
+    (False, 'STAR'): _ParseState.star,
+    (False, 'MIRACLE'): _ParseState.miracle,
+    (False, 'WONDER'): _ParseState.wonder,
+    (True, 'DIGIT'): _ParseState.parens_digit,
+    (True, 'ZERO'): _ParseState.parens_digit,
+    (True, 'CLOSE'): _ParseState.close_parens,
+}
+
+
 class SymGrp():
     """Immutable symmetry group from orbifold signature.
 
     Iterating over the group returns its elements, stored in
     self.all_axes, which gives pairs (axis, scale) where each axis is
     a quaternion and the scale is a three-element tuple corresponding
-    to the three axes.
+    to the three axes. Indexing also gives such a pair, while slicing
+    gives the corresponding rows of quats_array and scales_array.
 
     The read-only properties defined are:
     * gyrations, kaleidoscopes, stars, xs, os # Features of the orbifold
     * signature                               # Get orbifold signature
     * axes, inverse_axes, all_axes            # Get group of quaternions
+    * quats_array, scales_array               # all_axes as NumPy arrays
     * tile                                    # Fundamental tile
     * has_inverse_symmetries, gyrational      # Booleans
     * type                                    # Spherical, planar, etc.
     * cost, n_symmetries                      # Numbers from the signature
 
+    Properties derived from the signature are computed once, while
+    parsing it.
+
+    Since groups are immutable, they can be shared; `sym_grp` keeps
+    the most recently used ones.
+
     """
-    def __init__(self, signature, *, calculate_axes = True):
+    __slots__ = (
+        '_stars', '_xs', '_os', '_gyrations', '_kaleidoscopes',
+        '_has_inf', '_has_inverse', '_cost', '_n_symmetries', '_type',
+        '_signature', '_kind', '_axes', '_inverse_axes', '_tile',
+        '_quats_arr', '_scales_arr',
+    )
+
+    def __init__(self, signature, *, calculate_axes = False):
         """Returns a SymGrp object given an orbifold signature.
         
         Each character of a well-formed signature lies in
@@ -58,8 +223,8 @@ class SymGrp():
         it, and probably a different fundamental tile. For more
         information, see the docstring on `tile`.
 
-        Option 'calculate_axes' can be turned off for debugging
-        purposes.
+        The axes and the tile are calculated the first time they are
+        needed, or right away if 'calculate_axes' is True.
 
         EXAMPLE:
         > G = SymGrp("*432") # Symmetry group of a cube
@@ -71,15 +236,26 @@ class SymGrp():
 
         """
         self._parse(signature)
-        self._axes = self._tile = self._inverse_axes = self._all_axes = None
+        self._axes = self._tile = self._inverse_axes = None
+        self._quats_arr = self._scales_arr = None
         if calculate_axes:
             self._calculate_axes()
-            assert(len(self) == self.n_symmetries)
 
     def _calculate_axes(self):
         self._axes, self._inverse_axes, self._tile = self._get_axes()
-        self._all_axes = (*((ax, Vector((1,1,1))) for ax in self.axes),
-                          *((ax, Vector((1,-1,1))) for ax in self.inverse_axes))
+        if __debug__:
+            assert (len(self._axes) + len(self._inverse_axes)
+                    == self.n_symmetries)
+
+    def _calculate_arrays(self):
+        axes, inverse_axes = self.axes, self.inverse_axes
+        self._quats_arr = np.array(
+            [tuple(q) for q in (*axes, *inverse_axes)],
+            dtype=float).reshape(-1, 4)
+        self._scales_arr = np.ones((len(self._quats_arr), 3))
+        self._scales_arr[len(axes):, 1] = -1
+        for array in self._quats_arr, self._scales_arr:
+            array.flags.writeable = False
             
     @property
     def stars(self):
@@ -127,74 +303,69 @@ class SymGrp():
 
     def _parse(self, signature):
         """Obtain the centers and stuff from the signature"""
-        kaleidoscopes = []
-        gyrations = []
-        self._stars = 0                   # Kaleidoscopic points
-        self._xs = 0                      # Miracles
-        self._os = 0                      # Wanderings
-        
-        centers = gyrations
-        parens = None
+        state = _ParseState()
         try:
             for char in signature:
-                match char:
-                    case ")" if parens is not None:
-                        N = int("".join(parens))
-                        N = inf if N == 0 else N
-                        centers.append(N)
-                        parens = None
-                    case _ if parens is not None and char in digits:
-                        parens.append(char)
-                    case _ if parens is not None:
-                        raise ValueError(f"Non-digit '{char}' in parens")
-                    case "0" | "∞":
-                        centers.append(inf)
-                    case _ if char in digits:
-                        centers.append(int(char))
-                    case "*" | "★":
-                        centers = kaleidoscopes
-                        self._stars += 1
-                    case "x" | "❌" | "✕":
-                        self._xs += 1
-                        centers = ImmutableList(
-                            err = "Miracle (x) with centers is impossible"
-                        )
-                    case "o" if centers is gyrations:
-                        self._os += 1
-                    case "o":
-                        raise ValueError(
-                            "Wandering (o) after inverse symmetry is impossible"
-                        )
-                    case "(":
-                        parens = []
-                    case _:
-                        raise ValueError(f"Unwanted '{char}'")
-            if parens is not None:
+                in_parens = state.parens is not None
+                handler = _TRANSITIONS.get(
+                    (in_parens, _CHAR_CLASSES.get(char)))
+                if handler is None:
+                    raise ValueError(f"Non-digit '{char}' in parens"
+                                     if in_parens else
+                                     f"Unwanted '{char}'")
+                handler(state, char)
+            if state.parens is not None:
                 raise ValueError("Unclosed '('")
         except (ValueError, ImmutableModifyError) as e:
             new_e = BadSymGrpError() 
             new_e.args = ("Incorrect orbifold signature", *e.args)
             raise new_e from None
-        self._gyrations = tuple(n for n in gyrations if n != 1)
-        self._kaleidoscopes = tuple(n for n in kaleidoscopes if n != 1) 
+        self._stars = state.stars         # Kaleidoscopic points
+        self._xs = state.xs               # Miracles
+        self._os = state.os               # Wanderings
+        self._gyrations = tuple(n for n in state.gyrations if n != 1)
+        self._kaleidoscopes = tuple(n for n in state.kaleidoscopes if n != 1) 
+        self._has_inf = inf in self._gyrations or inf in self._kaleidoscopes
+        self._has_inverse = bool(self._stars or self._xs)
+        self._cost = (sum(1 - 1/n for n in self._gyrations)
+                      + sum(1/2 - 1/(2*n) for n in self._kaleidoscopes)
+                      + self._stars + self._xs + 2*self._os)
+        try:
+            self._n_symmetries = round(2/(2 - self._cost))
+        except ZeroDivisionError:
+            self._n_symmetries = inf
+        if self._cost > 2:
+            self._type = 'HYPERBOLIC'
+        elif self._cost < 2:
+            self._type = 'SPHERICAL'
+        elif self._has_inf:
+            self._type = 'FRIEZE'
+        else:
+            self._type = 'PLANAR'
+        self._signature = "".join((
+            *map(_center_str, self._gyrations),
+            "o" * self._os,
+            "*" * self._stars,
+            *map(_center_str, self._kaleidoscopes),
+            "x" * self._xs,
+        ))
+        self._kind = _classify(self)
         
     @property
     def cost(self):
         """The cost of the orbifold signature"""
-        return (sum(1 - 1/n for n in self.gyrations)
-                + sum(1/2 - 1/(2*n) for n in self.kaleidoscopes)
-                + self.stars + self.xs + 2*self.os)
+        return self._cost
     
     @property
     def has_inverse_symmetry(self):
         """Whether there is an inverse symmetry (kaleidoscope or miracle)"""
-        return bool(self.stars or self.xs)
+        return self._has_inverse
 
     @property
     def gyrational(self):
         """The opposite of self.has_inverse_symmetry (all direct
         symmetries)"""
-        return not self.has_inverse_symmetry
+        return not self._has_inverse
     
     @property
     def n_symmetries(self):
@@ -202,36 +373,16 @@ class SymGrp():
         in the hyperbolic case.
 
         """
-        try:
-            value = round(2/(2 - self.cost))
-        except ZeroDivisionError:
-            value = inf
-        return value
+        return self._n_symmetries
     
     @property
     def type(self):
         """One of 'SPHERICAL', 'PLANAR', 'FRIEZE', 'HYPERBOLIC'"""
-        if self.cost > 2:
-            return 'HYPERBOLIC'
-        if self.cost < 2:
-            return 'SPHERICAL'
-        if inf in (*self.gyrations, *self.kaleidoscopes):
-            return 'FRIEZE'
-        return 'PLANAR'
+        return self._type
     
     def _get_axes(self):
         """Calculates the axis and fundamental tile"""
-        match self.type:
-            case 'HYPERBOLIC':
-                raise BadSymGrpError(
-                    f"Hyperbolic groups not supported (cost {self.cost} > 2)"
-                )
-
-            case ('FRIEZE' | 'PLANAR'):
-                raise NotImplementedError("Non-spherical symmetry group")
-
-            case 'SPHERICAL':
-                return spherical_get_axes(self)
+        return _AXES_HANDLERS[self._kind](self)
     
     @property
     def axes(self):
@@ -260,10 +411,25 @@ class SymGrp():
         a quaternion, indicating rotation, and the second one is a
         scaling vector to apply after the rotation.
 
+        The pairs are not stored, but made when accessed.
+
         """
-        if self._all_axes is None:
-            self._calculate_axes()
-        return self._all_axes
+        return _AllAxesView(self.axes, self.inverse_axes)
+
+    @property
+    def quats_array(self):
+        """Read-only (N, 4) array with the quaternions of all_axes, as
+        rows (w, x, y, z)"""
+        if self._quats_arr is None:
+            self._calculate_arrays()
+        return self._quats_arr
+
+    @property
+    def scales_array(self):
+        """Read-only (N, 3) array with the scales of all_axes"""
+        if self._scales_arr is None:
+            self._calculate_arrays()
+        return self._scales_arr
     
     @property
     def tile(self):
@@ -284,96 +450,73 @@ class SymGrp():
 
         """  
         if self._tile is None:
-            self.calculate_axes()
+            self._calculate_axes()
         return self._tile
 
     @property
     def signature(self):
         """Orbifold signature"""
-        sig = []
-        for centers, name in ((self._gyrations, "gyrations"),
-                              (self._kaleidoscopes, "kaleidoscopes")):
-            for N in centers:
-                if N == inf:
-                    sig.append("0")
-                elif N < 10:
-                    sig.append(str(N))
-                else:
-                    sig.append(f"({N!r})")
-            if name == "gyrations":
-                sig.append("o" * self._os  +  "*" * self._stars)
-            else:
-                sig.append("x" * self._xs)
-        return "".join(sig)
+        return self._signature
+
+    def __reduce__(self):
+        # Copies and pickles only keep the signature; the axes, which
+        # mathutils cannot pickle, are calculated again when needed
+        return type(self), (self._signature,)
 
     def __repr__(self):
         return f"SymGrp('{self.signature}')"
 
     def __getitem__(self, position):
-        return self.all_axes[position]
+        if isinstance(position, slice):
+            return self.quats_array[position], self.scales_array[position]
+        return (Quaternion(self.quats_array[position].tolist()),
+                Vector(self.scales_array[position].tolist()))
+
+    def __iter__(self):
+        return iter(self.all_axes)
 
     def __len__(self):
         return len(self.all_axes)
 
 
-def spherical_get_axes(group):
-    """Get the elements of a spherical group"""
-    # Default for when there are no symmetries
-    axes = (Quaternion(),)
-    inverse_axes = ()
-    verts = (Vector((0,0,1)), Vector((0,0,-1)),
-             Vector((1,0,0)), Vector((-1,0,0)),
-             Vector((0,1,0)), Vector((0,-1,0)),
-             )
-    faces = ((0,2,4), (0,5,2), (0,4,3), (0,3,5),
-             (1,4,2), (1,2,5), (1,3,4), (1,5,3),
-             )
+@lru_cache(maxsize=128)
+def sym_grp(signature):
+    """SymGrp for the signature, cached so that the most recently used
+    groups are not calculated again. Calling SymGrp directly bypasses
+    this cache.
+
+    """
+    return SymGrp(signature)
+
+
+def _classify(group):
+    """Kind of group, which determines how its axes and tile are
+    calculated. Non-spherical groups are classified by their type.
+
+    Raises BadSymGrpError for spherical signatures that do not
+    correspond to any group.
+
+    """
+    if group.type != 'SPHERICAL':
+        return group.type
 
     match group:
-        case _ if inf in [*group.gyrations, *group.kaleidoscopes]:
+        case _ if group._has_inf:
             raise BadSymGrpError(
                 "Spherical groups cannot have infinites (0)"
             )
 
         # Gyrational or chiral spherical groups
         case SymGrp(gyrational = True, gyrations = []):
-            pass                                 # * Group C_1 (unit)
+            return 'C1'
 
         case SymGrp(gyrational = True, gyrations = [M, N]):
-            if M != N:                           # * Group C_N (cyclyc)
+            if M != N:
                 raise BadSymGrpError("Spherical group MN must have M = N")
-            axes = tuple(Quaternion((0, 0, 1), i*2*pi/N) for i in range(N))
-            verts = (Vector((0, 0, 1)),
-                     Vector((0, 0, -1)),
-                     Vector((1, 0, 0)),
-                     Quaternion((0,0,1), pi/N) @ Vector((1, 0, 0)),
-                     Quaternion((0,0,1), 2*pi/N) @ Vector((1, 0, 0)))
-            faces = (0,2,3), (0,3,4), (1,3,2), (1,4,3)
-
-        case SymGrp(gyrational = True, gyrations = [M, N, P]):
-            A, B, C = pi/M, pi/N, pi/P           # * Other
-
-            # Side lengths
-            c = acos((cos(C) + cos(A)*cos(B))/(sin(A)*sin(B)))
-            b = acos((cos(B) + cos(C)*cos(A))/(sin(C)*sin(A)))
-
-            # Vertices and faces
-            pa = Vector((0, 0, 1))
-            pb = Quaternion((0, 1, 0), c) @ pa
-            v = Vector((0,1,0))
-            v.rotate(Quaternion((0,0,1), A))
-            pc = pa.copy()
-            pc.rotate(Quaternion(v, b))
-
-            verts = (pa, pb, pc, pc * Vector((1,-1,1)))
-            faces = (0,1,2), (0,3,1)
-
-            # Rotation axes
-            axes = group_from_gens_size(
-                [Quaternion(pa, 2*A),
-                 Quaternion(pb, 2*B),
-                 Quaternion(pc, 2*C)], 
-                group.n_symmetries)
+            return 'NN'
+
+        case SymGrp(gyrational = True, gyrations = [_, _, _]):
+            return 'MNP'
 
         case SymGrp(gyrational = True):
             raise BadSymGrpError(
@@ -381,70 +524,17 @@ def spherical_get_axes(group):
             )
 
         # Mixed spherical groups
-        case SymGrp(gyrations = [2], kaleidoscopes = [N]):
-            # Vertices and faces
-            pa = Vector((1,0,0))
-            pb = Vector((0,0,1))
-            pc = Quaternion((1,0,0),   pi/(2*N)) @ Vector((0,0,1))
-            pd = Quaternion((1,0,0), 2*pi/(2*N)) @ Vector((0,0,1))
-            verts = (pa, pb, pc, pd)
-            faces = (0,1,2), (0,2,3)
-
-            # Rotation axes
-            axes = group_from_gens_size(
-                (Quaternion((1,0,0), 2*pi/N), Quaternion(pc, pi)),
-                group.n_symmetries // 2)
+        case SymGrp(gyrations = [2], kaleidoscopes = [_]):
+            return '2*N'
 
         case SymGrp(gyrations = [3], kaleidoscopes = [2]):
-            A, B, C = pi/4, pi/2, pi/3           # * Group 3*2
-
-            # Side lengths
-            b = acos((cos(B) + cos(C)*cos(A))/(sin(C)*sin(A)))
-
-            # Vertices and faces
-            v = Quaternion((0,0,1), A) @ Vector((0,1,0))
-            pa = Vector((0,0,1))
-            pb = Quaternion((0,1,0), pi/4) @ pa
-            pc = Vector((1,0,0))
-            pd = Quaternion(v, b) @ pa
-
-            verts = pa, pb, pc, pd
-            faces = (0,1,3), (1,2,3)
-
-            # Rotation axes
-            axes = group_from_gens_size(
-                (Quaternion(pd, 2*pi/3),
-                 Quaternion((0,0,1), pi)),
-                group.n_symmetries // 2)
-
-        case SymGrp(gyrations = [N], stars = 1,
-                    kaleidoscopes = []):
-            # Vertices and faces                 # * Group N*
-            pa = Vector((0,1,0))
-            pb = Vector((0,0,1))
-            pc =  Quaternion((0,1,0), pi/N) @ pb
-            pd =  Quaternion((0,1,0), 2*pi/N) @ pb
-            verts = pa, pb, pc, pd
-            faces = (0,1,2), (0,2,3)
-
-            # Rotation axes
-            axes = tuple(Quaternion((0,1,0), n*2*pi/N)
-                            for n in range(N))
-
-        case SymGrp(gyrations = [N], xs = 1, kaleidoscopes = []):
-            # Vertices and faces                 # * Group Nx
-            pa = Vector((0,1,0))
-            pb = Vector((0,0,1))
-            pc =  Quaternion((0,1,0), pi/N) @ pb
-            pd =  Quaternion((0,1,0), 2*pi/N) @ pb
-            verts = pa, pb, pc, pd
-            faces = (0,1,2), (0,2,3)
-
-            # Rotation axes
-            axes = tuple(Quaternion((0,1,0), n*2*pi/N)
-                            for n in range(N))
-            inverse_axes = tuple(Quaternion((0,1,0), n*2*pi/N + pi/N)
-                                    for n in range(N))
+            return '3*2'
+
+        case SymGrp(gyrations = [_], stars = 1, kaleidoscopes = []):
+            return 'N*'
+
+        case SymGrp(gyrations = [_], xs = 1, kaleidoscopes = []):
+            return 'Nx'
 
         case SymGrp(gyrational = False, gyrations = [_,*_]):
             raise BadSymGrpError(
@@ -453,51 +543,18 @@ def spherical_get_axes(group):
 
         # Groups with no gyrations or miracles
         case SymGrp(gyrations = [], xs = 1):
-            # Vertices and faces                 # * Single miracle
-            verts = verts[:-1]  
-            faces = (0,2,4), (0,4,3), (1,4,2), (1,3,4)
-
-            # Rotation axes
-            inverse_axes = (Quaternion((0,1,0), pi),)
+            return 'x'
 
         case SymGrp(gyrations = [], kaleidoscopes = []):
-            verts = verts[:-1]                   # * Group D_1 single mirror
-            faces = (0,2,4), (0,4,3), (1,4,2), (1,3,4)
+            return '*'
 
         case SymGrp(gyrations = [], kaleidoscopes = [M, N]):
-            if M != N:                           # * Group D_N (dyhedric)
+            if M != N:
                 raise BadSymGrpError("Spherical group *MN must have M = N")
-            verts = (Vector((0, 0, 1)),
-                     Vector((0, 0, -1)),
-                     Vector((1, 0, 0)),
-                     Quaternion((0,0,1), pi/N) @ Vector((1, 0, 0)),)
-            faces = (0,2,3), (1,3,2)
-            axes = tuple(Quaternion((0, 0, 1), i*2*pi/N) for i in range(N))
-
-        case SymGrp(gyrations = [], kaleidoscopes = [M, N, P]):
-            A, B, C = pi/M, pi/N, pi/P           # * Other
-
-            # Side lengths
-            c = acos((cos(C) + cos(A)*cos(B))/(sin(A)*sin(B)))
-            b = acos((cos(B) + cos(C)*cos(A))/(sin(C)*sin(A)))
-
-            # Vertices and faces
-            pa = Vector((0, 0, 1))
-            pb = Quaternion((0, 1, 0), c) @ pa
-            v = Vector((0,1,0))
-            v.rotate(Quaternion((0,0,1), A))
-            pc = pa.copy()
-            pc.rotate(Quaternion(v, b))
-
-            verts = pa, pb, pc
-            faces = ((0,1,2),)
-
-            # Rotation axes
-            axes = group_from_gens_size(
-                [Quaternion(pa, 2*A),
-                 Quaternion(pb, 2*B),
-                 Quaternion(pc, 2*C)], 
-                group.n_symmetries // 2)
+            return '*NN'
+
+        case SymGrp(gyrations = [], kaleidoscopes = [_, _, _]):
+            return '*MNP'
 
         case SymGrp(gyrational = False):
             raise BadSymGrpError(
@@ -507,6 +564,170 @@ def spherical_get_axes(group):
         case _:
             raise BadSymGrpError("Bug: non-existing group found")
 
-    if group.has_inverse_symmetry and not group.xs:
+
+# Vertices of the tile of 3*2 that are not on the axes. Its triangle
+# has angles A = pi/4 at the North pole, pi/2 and pi/3. pb is the
+# North pole rotated by A around Y, and pd is the North pole rotated
+# by the side opposite to pi/2 around Y rotated by A around Z.
+_3S2_A = pi/4
+_3S2_SIDE = acos((cos(pi/2) + cos(pi/3)*cos(_3S2_A))
+                 / (sin(pi/3)*sin(_3S2_A)))
+_3S2_PB = Vector((sin(_3S2_A), 0, cos(_3S2_A))).freeze()
+_3S2_PD = Vector((cos(_3S2_A)*sin(_3S2_SIDE),
+                  sin(_3S2_A)*sin(_3S2_SIDE),
+                  cos(_3S2_SIDE))).freeze()
+
+
+# Each of the following functions calculates the axes, inverse axes,
+# vertices and faces of one kind of spherical group
+
+def _axes_C1(group):                             # * Group C_1 (unit)
+    return (Quaternion(),), (), _DEFAULT_VERTS, _DEFAULT_FACES
+
+
+def _axes_NN(group):                             # * Group C_N (cyclic)
+    N = group.gyrations[0]
+    step = pi/N
+    axes = tuple(Quaternion(_EZ, i*2*pi/N) for i in range(N))
+    verts = (_EZ, _NEZ, _EX,
+             rotate_axis_angle(_EZ, step, _EX),
+             rotate_axis_angle(_EZ, 2*step, _EX))
+    faces = (0,2,3), (0,3,4), (1,3,2), (1,4,3)
+    return axes, (), verts, faces
+
+
+def _axes_MNP(group):                            # * Other MNP and *MNP
+    # Both are built on the spherical triangle with angles pi/M, pi/N,
+    # pi/P. The rotations around its vertices by twice those angles
+    # generate the direct symmetries. With mirrors (*MNP), the direct
+    # symmetries are only half of the group, and the triangle is
+    # enough as a tile; otherwise its mirror image is added.
+    half = group.has_inverse_symmetry
+    M, N, P = group.kaleidoscopes if half else group.gyrations
+    pa, pb, pc = map(Vector, spherical_triangle(M, N, P))
+    gens = (Quaternion(pa, 2*pi/M), Quaternion(pb, 2*pi/N),
+            Quaternion(pc, 2*pi/P))
+    if half:
+        verts = pa, pb, pc
+        faces = ((0,1,2),)
+    else:
+        verts = (pa, pb, pc, pc * _NEG_Y)
+        faces = (0,1,2), (0,3,1)
+    size = group.n_symmetries // 2 if half else group.n_symmetries
+    axes = group_from_gens_size(gens, size)
+    return axes, (), verts, faces
+
+
+def _axes_2sN(group):                            # * Group 2*N
+    N = group.kaleidoscopes[0]
+    step = pi/(2*N)
+
+    # Vertices and faces
+    pa = _EX
+    pb = _EZ
+    pc = rotate_axis_angle(_EX, step, _EZ)
+    pd = rotate_axis_angle(_EX, 2*step, _EZ)
+    verts = (pa, pb, pc, pd)
+    faces = (0,1,2), (0,2,3)
+
+    # Rotation axes
+    axes = group_from_gens_size(
+        (Quaternion(_EX, 4*step), Quaternion(pc, pi)),
+        group.n_symmetries // 2)
+    return axes, (), verts, faces
+
+
+def _axes_3s2(group):                            # * Group 3*2
+    # Vertices and faces
+    pa = _EZ
+    pb = _3S2_PB
+    pc = _EX
+    pd = _3S2_PD
+
+    verts = pa, pb, pc, pd
+    faces = (0,1,3), (1,2,3)
+
+    # Rotation axes
+    axes = group_from_gens_size(
+        (Quaternion(pd, 2*pi/3), Quaternion(_EZ, pi)),
+        group.n_symmetries // 2)
+    return axes, (), verts, faces
+
+
+def _axes_Ns(group):                             # * Group N*
+    N = group.gyrations[0]
+    step = pi/N
+
+    # Vertices and faces
+    pa = _EY
+    pb = _EZ
+    pc = rotate_axis_angle(_EY, step, pb)
+    pd = rotate_axis_angle(_EY, 2*step, pb)
+    verts = pa, pb, pc, pd
+    faces = (0,1,2), (0,2,3)
+
+    # Rotation axes
+    axes = tuple(Quaternion(_EY, n*2*pi/N) for n in range(N))
+    return axes, (), verts, faces
+
+
+def _axes_Nx(group):                             # * Group Nx
+    axes, _, verts, faces = _axes_Ns(group)
+    N = group.gyrations[0]
+    inverse_axes = tuple(Quaternion(_EY, n*2*pi/N + pi/N)
+                         for n in range(N))
+    return axes, inverse_axes, verts, faces
+
+
+def _axes_x(group):                              # * Single miracle
+    verts = _DEFAULT_VERTS[:-1]
+    faces = (0,2,4), (0,4,3), (1,4,2), (1,3,4)
+    return (Quaternion(),), (Quaternion(_EY, pi),), verts, faces
+
+
+def _axes_s(group):                              # * Group D_1 single mirror
+    verts = _DEFAULT_VERTS[:-1]
+    faces = (0,2,4), (0,4,3), (1,4,2), (1,3,4)
+    return (Quaternion(),), (), verts, faces
+
+
+def _axes_sNN(group):                            # * Group D_N (dihedral)
+    N = group.kaleidoscopes[0]
+    verts = (_EZ, _NEZ, _EX,
+             rotate_axis_angle(_EZ, pi/N, _EX))
+    faces = (0,2,3), (1,3,2)
+    axes = tuple(Quaternion(_EZ, i*2*pi/N) for i in range(N))
+    return axes, (), verts, faces
+
+
+_SPHERICAL_HANDLERS = {
+    'C1': _axes_C1, 'NN': _axes_NN, 'MNP': _axes_MNP,
+    '2*N': _axes_2sN, '3*2': _axes_3s2, 'N*': _axes_Ns, 'Nx': _axes_Nx,
+    'x': _axes_x, '*': _axes_s, '*NN': _axes_sNN, '*MNP': _axes_MNP,
+}
+
+
+def spherical_get_axes(group):
+    """Get the elements of a spherical group"""
+    axes, inverse_axes, verts, faces = _SPHERICAL_HANDLERS[group._kind](group)
+    if group._has_inverse and not group._xs:
         inverse_axes = axes
     return axes, inverse_axes, (verts, faces)
+
+
+def _hyperbolic_get_axes(group):
+    raise BadSymGrpError(
+        f"Hyperbolic groups not supported (cost {group.cost} > 2)"
+    )
+
+
+def _euclidean_get_axes(group):
+    raise NotImplementedError("Non-spherical symmetry group")
+
+
+_AXES_HANDLERS = {
+    'HYPERBOLIC': _hyperbolic_get_axes,
+    'PLANAR': _euclidean_get_axes,
+    'FRIEZE': _euclidean_get_axes,
+    **dict.fromkeys(_SPHERICAL_HANDLERS, spherical_get_axes),
+}
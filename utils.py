@@ -1,68 +1,85 @@
 """Utility functions that do not depend on bpy, but might depend on
-mathutils. Also re-exports mathutils' Quaternion and Vector."""
+mathutils. Also re-exports mathutils' Matrix, Quaternion and Vector."""
 from itertools import product
+from math import cos, sin
 
-from mathutils import Quaternion, Vector
+import numpy as np
+from mathutils import Matrix, Quaternion, Vector
 
+from ._qmath import enum_group
 
-class ImmutableModifyError(Exception):
-    """An ImmutableList has been modified"""
-    pass
-
+# Up to this size, a plain mathutils loop beats the uncompiled array
+# search, whose steps have a fixed overhead
+_LOOP_MAX_SIZE = 48
 
-class ImmutableList(list):
-    """A hack for adding a custom error to a list if it is modified"""
-    def __init__(self, *args, err="Immutable list cannot be modified"):
-        self.err = err
-        super().__init__(*args)
 
-    def _raise_error(self, *args, **kwargs):
-        raise ImmutableModifyError(self.err)
-
-_mutating_methods = {
-    "append", "extend", "clear", "insert", "pop",
-    "remove", "sort", "reverse", "__setitem__", "__delitem__",
-    "__iadd__", "__imul__"
-}
-for method in _mutating_methods:
-   setattr(ImmutableList, method, ImmutableList._raise_error)
+class ImmutableModifyError(Exception):
+    """Something that cannot be modified has been modified"""
+    pass
 
 
 def approximate_in(q, ps, epsilon = 1e-2):
-    """Whether quaternion q or its opposite is in qs, with a tolerance
-    of epsilon.
+    """Whether quaternion q or its opposite is in ps, with a tolerance
+    of epsilon. Used by `group_from_gens_size` on small groups.
 
     """
+    epsilon2 = epsilon * epsilon
     for p in ps:
-        if (p-q).magnitude < epsilon or (p+q).magnitude < epsilon:
+        # Squared distances, to avoid the square roots
+        d, s = p - q, p + q
+        if d.dot(d) < epsilon2 or s.dot(s) < epsilon2:
             return True
     return False
 
 
-def group_from_gens_size(gens, size):
+def rotate_axis_angle(axis, angle, v):
+    """Rotates the vector v by angle around the unit vector axis.
+    Equivalent to Quaternion(axis, angle) @ Vector(v), but without
+    building the quaternion: with q = (s, u), the rotated vector is
+    v + s*t + u×t, where t = 2u×v.
+
+    """
+    h = angle / 2
+    s, sin_h = cos(h), sin(h)
+    ux, uy, uz = (sin_h*c for c in axis)
+    x, y, z = v
+    tx, ty, tz = 2*(uy*z - uz*y), 2*(uz*x - ux*z), 2*(ux*y - uy*x)
+    return Vector((x + s*tx + uy*tz - uz*ty,
+                   y + s*ty + uz*tx - ux*tz,
+                   z + s*tz + ux*ty - uy*tx))
+
+
+def group_from_gens_size(gens, size, epsilon = 1e-2):
     """Returns a tuple of all the elements in a finite group of
      quaternions from the generators and the size.
 
     The gens must be an iterable of quaternions, and size must be a
-    positive integer.
-
-    The algorithm is the obvious one, so the time could blow up for
-    large groups, which should be rare in practice.
+    positive integer. Quaternions closer than epsilon (or than epsilon
+    to the opposite) are considered the same, as in `approximate_in`.
 
-    More refined algorithms would use abstract presentations (e.g.,
-    Todd-Coxeter). Possible group elements would form a countable, and
-    thus hashable, set, reducing the amount of loops.
+    The algorithm is the obvious breadth-first search. Groups of up to
+    `_LOOP_MAX_SIZE` elements are searched with mathutils; larger
+    ones, on arrays by `_qmath.enum_group`, compiled with numba when
+    available. More refined algorithms would use abstract
+    presentations (e.g., Todd-Coxeter).
 
     """
-    group = [Quaternion()]
-    new_els = [Quaternion()] 
-    while True:
-        last_els, new_els = new_els, []
-        for gen, g in product(gens, last_els):
-            if not approximate_in(h := g @ gen, group):
-                new_els.append(h)
-                group.append(h)
-                if len(group) >= size:
-                    return tuple(group)
-        if not new_els:
-            raise ValueError("get_spherical_group: 'size' larger than actual")
+    if size <= _LOOP_MAX_SIZE:
+        group = [Quaternion()]
+        new_els = [Quaternion()]
+        while len(group) < size:
+            last_els, new_els = new_els, []
+            for gen, g in product(gens, last_els):
+                if not approximate_in(h := g @ gen, group, epsilon):
+                    new_els.append(h)
+                    group.append(h)
+                    if len(group) >= size:
+                        return tuple(group)
+            if not new_els:
+                raise ValueError("get_spherical_group: 'size' larger than actual")
+        return tuple(group)
+
+    group = np.empty((size, 4))
+    if enum_group(np.asarray(gens, dtype=float), group, epsilon**2) < size:
+        raise ValueError("get_spherical_group: 'size' larger than actual")
+    return tuple(map(Quaternion, group.tolist()))